@@ -27,22 +27,56 @@ Features:
 ===============================================================================
 """
 
+import bisect
+import io
+import re
 import sys
 import os
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
+
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QGraphicsView, QGraphicsScene,
-    QGraphicsRectItem, QGraphicsPixmapItem, QDockWidget, QListWidget,
+    QGraphicsRectItem, QDockWidget, QListWidget,
     QListWidgetItem, QFileDialog, QInputDialog, QMessageBox,
     QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QEvent, QRectF, QPointF, QRunnable, QSize, QSignalBlocker,
+    QThreadPool, QTimer, pyqtSignal
+)
 from PyQt6.QtGui import (
-    QPixmap, QPen, QColor, QBrush, QAction, QKeySequence,
-    QPainter, QWheelEvent, QMouseEvent
+    QPixmap, QPen, QColor, QBrush, QAction, QFont, QImageReader,
+    QKeySequence, QPainter, QWheelEvent, QMouseEvent
 )
 
+# Matches a "[id] name" line in classes.txt
+CLASS_LINE_PATTERN = re.compile(r"^\[(\d+)\]\s*(.+)$")
+
+# One YOLO label line: class id plus four normalized coordinates
+YOLO_LINE_FORMAT = "%d %.6f %.6f %.6f %.6f"
+
+# Recognized image suffixes (no dot), compared case-insensitively
+IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'bmp', 'pbm', 'tif', 'tiff'})
+
+# Cached directory listings: resolved path -> (st_mtime_ns, sorted names).
+# Entries self-invalidate because any file added to or removed from the
+# directory bumps its mtime.
+_dir_listing_cache: dict = {}
+
+# Immutable colors shared across the UI - built once at import instead of
+# per use on the selection/edit paths
+SELECTION_HIGHLIGHT_COLOR = QColor(255, 255, 255)  # White
+EDIT_HIGHLIGHT_COLOR = QColor(255, 255, 0)         # Yellow
+DEFAULT_NEW_CLASS_COLOR = QColor(0, 255, 0)        # Green
+LABEL_TEXT_COLOR = QColor(0, 0, 0)                 # Black
+
 
 # ============================================================================
 # RESIZE HANDLE CLASS
@@ -57,18 +91,19 @@ class ResizeHandle(QGraphicsRectItem):
     Handles are parented to their box, so they move together automatically.
     """
     
-    def __init__(self, position: str, parent_bbox: QGraphicsRectItem):
+    def __init__(self, position: str, parent_bbox: Optional[QGraphicsRectItem]):
         """
         Initialize a resize handle.
-        
+
         Args:
             position: Position identifier ('top-left', 'top-right', etc.)
             parent_bbox: The graphics item of the parent bounding box
+                (None for pooled handles awaiting assignment)
         """
         super().__init__(-5, -5, 10, 10)  # 10x10 handle centered on position
         self.position = position
         self.parent_bbox = parent_bbox
-        
+
         # Visual appearance
         self.setBrush(QBrush(QColor(255, 255, 0)))  # Yellow fill
         self.setPen(QPen(QColor(0, 0, 0), 2))  # Black border
@@ -77,42 +112,88 @@ class ResizeHandle(QGraphicsRectItem):
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         self.setCursor(Qt.CursorShape.SizeAllCursor)
-        
-        self.start_rect = None
-        self.start_pos = None
-    
-    def mousePressEvent(self, event):
-        """Handle mouse press - store initial state for resizing."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.start_rect = QRectF(self.parent_bbox.rect())
-            self.start_pos = event.scenePos()
-        super().mousePressEvent(event)
-    
+
+    def _apply_delta(self, rect: QRectF, dx: float, dy: float):
+        """Adjust the edges this handle controls (overridden per corner)."""
+        raise NotImplementedError
+
     def mouseMoveEvent(self, event):
         """Handle mouse move - resize the parent box based on handle drag."""
-        if self.start_rect:
-            delta = event.scenePos() - self.start_pos
-            new_rect = QRectF(self.start_rect)
-            
-            # Adjust rectangle based on which handle is being dragged
-            if 'top' in self.position:
-                new_rect.setTop(self.start_rect.top() + delta.y())
-            if 'bottom' in self.position:
-                new_rect.setBottom(self.start_rect.bottom() + delta.y())
-            if 'left' in self.position:
-                new_rect.setLeft(self.start_rect.left() + delta.x())
-            if 'right' in self.position:
-                new_rect.setRight(self.start_rect.right() + delta.x())
-            
-            # Enforce minimum size (prevents box from collapsing)
-            if new_rect.width() > 10 and new_rect.height() > 10:
-                self.parent_bbox.setRect(new_rect.normalized())
-                # Update handle positions
-                if hasattr(self.scene(), 'update_resize_handles'):
-                    self.scene().update_resize_handles()
-                # Update label position and size
-                if hasattr(self.scene(), 'update_box_label'):
-                    self.scene().update_box_label(self.parent_bbox)
+        if self.parent_bbox is None:
+            return
+
+        # Incremental delta since the previous event - no press-time
+        # snapshot or QRectF copy needed
+        pos = event.scenePos()
+        last = event.lastScenePos()
+        dx = pos.x() - last.x()
+        dy = pos.y() - last.y()
+
+        # Adjust the edges this handle controls (specialized per corner)
+        new_rect = self.parent_bbox.rect()
+        self._apply_delta(new_rect, dx, dy)
+
+        # Enforce minimum size (prevents box from collapsing)
+        if new_rect.width() > 10 and new_rect.height() > 10:
+            self.parent_bbox.setRect(new_rect.normalized())
+            # Defer handle and label updates - coalesced to one flush
+            # per event loop turn instead of running per mouse event
+            scene = self.scene()
+            if isinstance(scene, AnnotationScene):
+                scene._schedule_edit_flush()
+
+
+class TopLeftHandle(ResizeHandle):
+    """Resize handle controlling the top and left edges."""
+
+    def _apply_delta(self, rect: QRectF, dx: float, dy: float):
+        rect.setTop(rect.top() + dy)
+        rect.setLeft(rect.left() + dx)
+
+
+class TopRightHandle(ResizeHandle):
+    """Resize handle controlling the top and right edges."""
+
+    def _apply_delta(self, rect: QRectF, dx: float, dy: float):
+        rect.setTop(rect.top() + dy)
+        rect.setRight(rect.right() + dx)
+
+
+class BottomLeftHandle(ResizeHandle):
+    """Resize handle controlling the bottom and left edges."""
+
+    def _apply_delta(self, rect: QRectF, dx: float, dy: float):
+        rect.setBottom(rect.bottom() + dy)
+        rect.setLeft(rect.left() + dx)
+
+
+class BottomRightHandle(ResizeHandle):
+    """Resize handle controlling the bottom and right edges."""
+
+    def _apply_delta(self, rect: QRectF, dx: float, dy: float):
+        rect.setBottom(rect.bottom() + dy)
+        rect.setRight(rect.right() + dx)
+
+
+# ============================================================================
+# BOX GRAPHICS ITEM CLASS
+# ============================================================================
+
+class BoxGraphicsItem(QGraphicsRectItem):
+    """
+    Graphics rectangle for a bounding box with direct label references.
+
+    Holds its label text/background items and the applied label font size
+    as plain Python attributes - attribute access is much cheaper on the
+    hot resize path than round-tripping through QGraphicsItem data(),
+    which boxes everything in QVariant.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.label_text = None  # QGraphicsTextItem showing the class name
+        self.label_bg = None  # Background rectangle behind the label
+        self.label_font_size = 0  # Last applied label font point size
 
 
 # ============================================================================
@@ -206,6 +287,136 @@ class BoundingBox:
         except (ValueError, IndexError):
             return None
 
+    @staticmethod
+    def parse_yolo_file(path, image_width: int, image_height: int):
+        """
+        Parse a whole YOLO label file into SoA arrays in one pass.
+
+        Loads the file as a 2D array and converts all rows from normalized
+        center coordinates to pixel corner rectangles with vectorized
+        arithmetic, avoiding the per-line str.split/float() overhead of
+        from_yolo_format when ingesting pre-annotated datasets.
+
+        Args:
+            path: Path to the YOLO label file
+            image_width: Width of the image in pixels
+            image_height: Height of the image in pixels
+
+        Returns:
+            Tuple of (class_ids, rects) where class_ids is an int array of
+            shape (N,) and rects is a float array of shape (N, 4) holding
+            (x, y, width, height) in pixel coordinates
+        """
+        # Empty label files are the YOLO convention for negative images;
+        # short-circuit them before loadtxt warns about missing data
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=np.int32), np.empty((0, 4), dtype=np.float64)
+
+        try:
+            with warnings.catch_warnings():
+                # Files holding only blank lines are also "no data"
+                warnings.simplefilter("ignore", UserWarning)
+                data = np.loadtxt(str(path), dtype=np.float64, ndmin=2)
+        except ValueError:
+            # loadtxt rejects the whole file on the first malformed line;
+            # fall back to per-line parsing so one garbage line does not
+            # discard every valid annotation around it
+            rows = []
+            with open(path) as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) != 5:
+                        continue
+                    try:
+                        rows.append([float(p) for p in parts])
+                    except ValueError:
+                        continue
+            data = np.array(rows, dtype=np.float64, ndmin=2)
+
+        if data.size == 0:
+            return np.empty(0, dtype=np.int32), np.empty((0, 4), dtype=np.float64)
+
+        if data.shape[1] != 5:
+            raise ValueError(f"Expected 5 columns in YOLO file, got {data.shape[1]}")
+
+        class_ids = data[:, 0].astype(np.int32)
+
+        # Vectorized center -> top-left corner conversion
+        widths = data[:, 3] * image_width
+        heights = data[:, 4] * image_height
+        xs = data[:, 1] * image_width - widths / 2
+        ys = data[:, 2] * image_height - heights / 2
+
+        rects = np.column_stack((xs, ys, widths, heights))
+        return class_ids, rects
+
+
+# ============================================================================
+# UNDO/REDO COMMANDS
+# ============================================================================
+
+@dataclass
+class AddBoxCommand:
+    """
+    Undo command recording the creation of a single box.
+
+    Stores only the affected box and its index, so undo/redo touches one
+    graphics item instead of rebuilding the whole scene.
+    """
+    index: int
+    bbox: 'BoundingBox'
+
+    def apply(self, scene: 'AnnotationScene'):
+        """Redo: re-insert the box at its original index."""
+        scene._insert_box(self.index, self.bbox)
+
+    def revert(self, scene: 'AnnotationScene'):
+        """Undo: remove the box again."""
+        scene._remove_box(self.index)
+
+
+@dataclass
+class DeleteBoxesCommand:
+    """
+    Undo command recording a batched deletion of boxes.
+
+    Indices are stored in ascending order alongside the removed boxes,
+    so the deletion can be replayed or reverted exactly.
+    """
+    indices: List[int]
+    boxes: List['BoundingBox']
+
+    def apply(self, scene: 'AnnotationScene'):
+        """Redo: remove the boxes again (highest index first)."""
+        for i in reversed(self.indices):
+            scene._remove_box(i)
+
+    def revert(self, scene: 'AnnotationScene'):
+        """Undo: re-insert the boxes at their original indices."""
+        for i, bbox in zip(self.indices, self.boxes):
+            scene._insert_box(i, bbox)
+
+
+@dataclass
+class MutateRectCommand:
+    """
+    Undo command recording a move/resize of a single box.
+
+    Stores the old and new rectangles so undo/redo only needs to update
+    one graphics item's geometry.
+    """
+    index: int
+    old_rect: QRectF
+    new_rect: QRectF
+
+    def apply(self, scene: 'AnnotationScene'):
+        """Redo: restore the edited rectangle."""
+        scene._set_box_rect(self.index, self.new_rect)
+
+    def revert(self, scene: 'AnnotationScene'):
+        """Undo: restore the original rectangle."""
+        scene._set_box_rect(self.index, self.old_rect)
+
 
 # ============================================================================
 # ANNOTATION SCENE CLASS
@@ -226,27 +437,55 @@ class AnnotationScene(QGraphicsScene):
     Signals:
         box_created: Emitted when a new box is created
         box_selected: Emitted when a box is selected in the viewer
+        box_modified: Emitted when a box is moved or resized
     """
-    
-    box_created = pyqtSignal()
+
+    box_created = pyqtSignal(object)  # Emits the new BoundingBox object
     box_selected = pyqtSignal(object)  # Emits BoundingBox object
+    box_modified = pyqtSignal()  # Geometry changed via edit mode
     
     def __init__(self, parent=None):
         """Initialize the annotation scene."""
         super().__init__(parent)
         
         # Image and drawing state
-        self.image_item: Optional[QGraphicsPixmapItem] = None
+        self._background_pixmap: Optional[QPixmap] = None
+        self._cached_scene_rect = QRectF()  # Image bounds, set on load
         self.current_box: Optional[QGraphicsRectItem] = None
         self.start_point: Optional[QPointF] = None
         self.image_width: int = 0
         self.image_height: int = 0
+        self.source_width: int = 0
+        self.source_height: int = 0
+        self._display_scale: float = 1.0
+        self._last_move_ts: float = 0.0
         
         # Bounding boxes storage
         self.boxes: List[BoundingBox] = []
+        self._item_to_bbox: dict = {}  # id(graphics_item) -> BoundingBox
+
+        # SoA mirror of box geometry for vectorized queries, rebuilt
+        # lazily after mutations (columns: left, top, right, bottom)
+        self._geom = np.empty((0, 4), dtype=np.float32)
+        self._cids = np.empty(0, dtype=np.int32)
+        self._geom_dirty: bool = True
         self.selected_box: Optional[BoundingBox] = None
         self.editing_box: Optional[BoundingBox] = None
         self.resize_handles: List[ResizeHandle] = []
+        self._edit_flush_scheduled: bool = False
+
+        # Pooled resize handles - reparented and repositioned on selection
+        # instead of destroying and recreating four items each time
+        self._handle_pool: List[ResizeHandle] = []
+        for position, handle_cls in (
+            ('top-left', TopLeftHandle),
+            ('top-right', TopRightHandle),
+            ('bottom-left', BottomLeftHandle),
+            ('bottom-right', BottomRightHandle),
+        ):
+            handle = handle_cls(position, None)
+            handle.setVisible(False)
+            self._handle_pool.append(handle)
         
         # Current class for new boxes
         self.current_class_id: int = 0
@@ -256,15 +495,30 @@ class AnnotationScene(QGraphicsScene):
         # Drawing mode control
         self.drawing_enabled: bool = True
         
-        # Undo/Redo functionality
-        self.undo_stack: List[List[BoundingBox]] = []
-        self.redo_stack: List[List[BoundingBox]] = []
+        # Undo/Redo functionality - stacks of delta commands, not snapshots
+        self.undo_stack: List[object] = []
+        self.redo_stack: List[object] = []
+        self.max_undo_depth: int = 50
         
         # Custom colors for classes (class_id -> QColor)
         self.class_custom_colors: dict = {}
-        
-        # Default color scheme for classes (fallback)
-        self.class_colors = [
+
+        # Memoized pens per class: class_id -> (color, normal, selected, edit)
+        self._pen_cache: dict = {}
+
+        # Label fonts are bold with point sizes clamped to 7..14, so all
+        # eight variants can be built once and reused by identity
+        self._font_by_size: dict = {}
+        for size in range(7, 15):
+            font = QFont()
+            font.setPointSize(size)
+            font.setBold(True)
+            self._font_by_size[size] = font
+        
+        # Default color scheme for classes (fallback) - frozen as a tuple;
+        # get_box_color relies on there being exactly 8 entries so the
+        # wrap-around can be a bitwise AND instead of len() + modulo
+        self.class_colors = (
             QColor(0, 255, 0, 150),      # Green
             QColor(255, 0, 0, 150),      # Red
             QColor(0, 0, 255, 150),      # Blue
@@ -273,7 +527,8 @@ class AnnotationScene(QGraphicsScene):
             QColor(0, 255, 255, 150),    # Cyan
             QColor(255, 128, 0, 150),    # Orange
             QColor(128, 0, 255, 150),    # Purple
-        ]
+        )
+        assert len(self.class_colors) == 8
     
     def set_image(self, pixmap: QPixmap):
         """
@@ -284,58 +539,174 @@ class AnnotationScene(QGraphicsScene):
         Args:
             pixmap: QPixmap containing the image to annotate
         """
+        # Finish any editing in progress
+        if self.editing_box:
+            self.finish_editing()
+
+        # Remove resize handles first
+        self.remove_resize_handles()
+
+        # Clear selection
+        self.selected_box = None
+        self.editing_box = None
+        self.current_box = None
+
+        # Suspend BSP indexing, change signals and repaints while the
+        # scene is rebuilt - per-item removeItem/addItem otherwise pays
+        # Qt index and signal overhead for every box
+        prev_index_method = self.itemIndexMethod()
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.blockSignals(True)
+        views = self.views()
+        for view in views:
+            view.setUpdatesEnabled(False)
+
         try:
-            # Finish any editing in progress
-            if self.editing_box:
-                self.finish_editing()
-            
-            # Remove resize handles first
-            self.remove_resize_handles()
-            
-            # Clear selection
-            self.selected_box = None
-            self.editing_box = None
-            self.current_box = None
-            
-            # Remove all box graphics items safely
-            for bbox in self.boxes[:]:  # Use slice to iterate over copy
-                if bbox.graphics_item:
-                    try:
-                        if bbox.graphics_item.scene() == self:
-                            self.removeItem(bbox.graphics_item)
-                        bbox.graphics_item = None
-                    except:
-                        pass
-            
-            # Clear boxes list
+            # scene.clear() deletes every item in one C++ tree walk, so no
+            # per-box removeItem loop is needed - just null the Python refs
+            for bbox in self.boxes:
+                bbox.graphics_item = None
             self.boxes.clear()
-            
+            self._item_to_bbox.clear()
+            self._geom_dirty = True
+
             # Clear the entire scene
             self.clear()
-            
+
             # Clear history
             self.undo_stack.clear()
             self.redo_stack.clear()
-            
-            # Add the new image
-            self.image_item = QGraphicsPixmapItem(pixmap)
-            self.addItem(self.image_item)
-            self.setSceneRect(self.image_item.boundingRect())
-            
-            self.image_width = pixmap.width()
-            self.image_height = pixmap.height()
-            
-        except Exception as e:
-            print(f"Error in set_image: {e}")
-            # Ensure scene is cleared even if error occurs
-            self.clear()
-            self.boxes.clear()
-            self.image_item = QGraphicsPixmapItem(pixmap)
-            self.addItem(self.image_item)
-            self.setSceneRect(self.image_item.boundingRect())
-            self.image_width = pixmap.width()
-            self.image_height = pixmap.height()
+
+            # The image is painted in drawBackground, not as a scene item
+            self._background_pixmap = pixmap
+        finally:
+            self.blockSignals(False)
+            self.setItemIndexMethod(prev_index_method)
+            for view in views:
+                view.setUpdatesEnabled(True)
+
+        self._cached_scene_rect = QRectF(pixmap.rect())
+        self.setSceneRect(self._cached_scene_rect)
+        # Drop any cached background from the previous image
+        self.invalidate(self._cached_scene_rect, QGraphicsScene.SceneLayer.BackgroundLayer)
+
+        self.image_width = pixmap.width()
+        self.image_height = pixmap.height()
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        """
+        Paint the current image as the scene background.
+
+        Combined with the view's CacheBackground mode, the image is
+        rasterized into the background cache once per transform change,
+        so annotation-only updates no longer repaint the full pixmap.
+
+        Args:
+            painter: Painter provided by the view
+            rect: Exposed rectangle that needs repainting
+        """
+        super().drawBackground(painter, rect)
+        if self._background_pixmap is not None:
+            target = rect.intersected(QRectF(self._background_pixmap.rect()))
+            if not target.isEmpty():
+                painter.drawPixmap(target, self._background_pixmap, target)
     
+    @staticmethod
+    def decode_image(path, view_size: Optional[QSize] = None):
+        """
+        Decode an image file to a QImage, downscaling huge files.
+
+        For very large scientific images (>16MP) the full-resolution decode
+        dominates image-switch time and resident memory. When a view size is
+        given, QImageReader decodes straight to 2x the fitted size (zoom
+        headroom), quartering memory for every halving of scale. QImage
+        decoding is safe off the GUI thread, so prefetch workers share
+        this helper; only the QPixmap conversion must stay on the GUI
+        thread.
+
+        Args:
+            path: Path to the image file
+            view_size: Size of the viewport the image will be fitted to
+
+        Returns:
+            Tuple of (QImage, source_width, source_height, display_scale),
+            or None on decode failure
+        """
+        reader = QImageReader(str(path))
+        reader.setAutoTransform(True)
+
+        src = reader.size()
+        display_scale = 1.0
+
+        if (view_size is not None and src.isValid()
+                and src.width() * src.height() > 16_000_000):
+            scale = min(
+                view_size.width() / src.width(),
+                view_size.height() / src.height()
+            ) * 2  # 2x oversample so moderate zoom-in stays sharp
+            if scale < 1.0:
+                reader.setScaledSize(QSize(
+                    max(1, round(src.width() * scale)),
+                    max(1, round(src.height() * scale))
+                ))
+                display_scale = scale
+
+        image = reader.read()
+        if image.isNull():
+            return None
+
+        return image, src.width(), src.height(), display_scale
+
+    def set_image_from_path(self, path, view_size: Optional[QSize] = None,
+                            decoded=None) -> bool:
+        """
+        Load an image from disk, decoding huge files at reduced scale.
+
+        YOLO coordinates are normalized, so annotations exported against
+        the scaled dimensions are identical to full-resolution ones; the
+        original dimensions are kept in source_width/source_height.
+
+        Args:
+            path: Path to the image file
+            view_size: Size of the viewport the image will be fitted to
+            decoded: Optional decode_image result (e.g. from a prefetch
+                worker) to reuse instead of decoding again
+
+        Returns:
+            True if the image was loaded, False on decode failure
+        """
+        if decoded is None:
+            decoded = self.decode_image(path, view_size)
+        if decoded is None:
+            return False
+
+        image, self.source_width, self.source_height, self._display_scale = decoded
+        self.set_image(QPixmap.fromImage(image))
+        return True
+
+    def set_image_metadata(self, path):
+        """
+        Store image dimensions from the file header without decoding pixels.
+
+        QImageReader.size() parses only the header - kilobytes read
+        instead of the megabytes a full QPixmap decode touches. Use this
+        in batch workflows (e.g. scanning a directory of pre-annotated
+        labels, where from_yolo_format only needs W/H) and defer the real
+        decode until the image is actually viewed. Never construct a
+        QPixmap when only dimensions are needed.
+
+        Args:
+            path: Path to the image file
+
+        Returns:
+            Tuple of (width, height)
+        """
+        size = QImageReader(str(path)).size()
+        self.image_width = size.width()
+        self.image_height = size.height()
+
+        return self.image_width, self.image_height
+
     def get_box_color(self, class_id: int) -> QColor:
         """
         Get display color for a class ID.
@@ -348,13 +719,37 @@ class AnnotationScene(QGraphicsScene):
         Returns:
             QColor for this class
         """
-        # Check if custom color exists for this class
-        if class_id in self.class_custom_colors:
-            return self.class_custom_colors[class_id]
-        
-        # Fall back to default color scheme
-        return self.class_colors[class_id % len(self.class_colors)]
-    
+        # Custom color if set, else wrap into the 8-entry default scheme
+        return self.class_custom_colors.get(class_id) or self.class_colors[class_id & 7]
+
+    def _pen_cache_for(self, class_id: int) -> tuple:
+        """
+        Get memoized (color, normal pen, selected pen, edit pen) for a class.
+
+        Avoids constructing fresh QColor/QPen objects on every draw start,
+        selection toggle, edit finalization and undo/redo replay.
+
+        Args:
+            class_id: The class ID
+
+        Returns:
+            Tuple of (QColor, QPen normal, QPen selected, QPen edit,
+            QPen draft)
+        """
+        cached = self._pen_cache.get(class_id)
+        if cached is None:
+            color = self.get_box_color(class_id)
+            cached = (
+                color,
+                QPen(color, 3),                  # Normal appearance (thicker pen)
+                QPen(SELECTION_HIGHLIGHT_COLOR, 4),  # White highlight, extra thick
+                QPen(EDIT_HIGHLIGHT_COLOR, 4),       # Yellow thick border for editing
+                QPen(color, 2, Qt.PenStyle.DashLine),  # In-progress draw outline
+            )
+            self._pen_cache[class_id] = cached
+        return cached
+
+
     def set_class_color(self, class_id: int, color: QColor):
         """
         Set custom color for a class.
@@ -364,6 +759,7 @@ class AnnotationScene(QGraphicsScene):
             color: QColor to use for this class
         """
         self.class_custom_colors[class_id] = color
+        self._pen_cache.pop(class_id, None)
     
     def set_current_class(self, class_id: int, class_name: str, color: Optional[QColor] = None):
         """
@@ -381,6 +777,7 @@ class AnnotationScene(QGraphicsScene):
         # Store custom color if provided
         if color:
             self.class_custom_colors[class_id] = color
+            self._pen_cache.pop(class_id, None)
     
     def mousePressEvent(self, event: QMouseEvent):
         """
@@ -413,11 +810,10 @@ class AnnotationScene(QGraphicsScene):
             # Start drawing new box if class is selected
             if self.current_class_name:
                 self.start_point = event.scenePos()
-                self.current_box = QGraphicsRectItem()
-                
-                color = self.get_box_color(self.current_class_id)
-                pen = QPen(color, 2, Qt.PenStyle.DashLine)
-                self.current_box.setPen(pen)
+                self.current_box = BoxGraphicsItem()
+
+                *_, pen_draft = self._pen_cache_for(self.current_class_id)
+                self.current_box.setPen(pen_draft)
                 
                 self.addItem(self.current_box)
         
@@ -430,12 +826,30 @@ class AnnotationScene(QGraphicsScene):
         Updates the current box rectangle while drawing.
         """
         if self.current_box and self.start_point:
-            # Update the rectangle as user drags
-            current_point = event.scenePos()
-            rect = QRectF(self.start_point, current_point).normalized()
-            self.current_box.setRect(rect)
-        
+            # Rate-limit rect updates to ~120Hz - high-rate input devices
+            # would otherwise trigger a geometry change per raw event
+            now = time.monotonic()
+            if now - self._last_move_ts >= 1.0 / 120.0:
+                self._last_move_ts = now
+                self._update_drag_rect(event.scenePos())
+
         super().mouseMoveEvent(event)
+
+    def _update_drag_rect(self, current_point: QPointF):
+        """
+        Update the in-progress box rectangle from the drag position.
+
+        Normalizes with four scalar min/max operations instead of
+        allocating a QRectF and calling normalized() per mouse event.
+
+        Args:
+            current_point: Current drag position in scene coordinates
+        """
+        sx, sy = self.start_point.x(), self.start_point.y()
+        cx, cy = current_point.x(), current_point.y()
+        x1, x2 = (sx, cx) if sx <= cx else (cx, sx)
+        y1, y2 = (sy, cy) if sy <= cy else (cy, sy)
+        self.current_box.setRect(x1, y1, x2 - x1, y2 - y1)
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """
@@ -445,35 +859,38 @@ class AnnotationScene(QGraphicsScene):
         Minimum size requirement prevents accidental tiny boxes.
         """
         if event.button() == Qt.MouseButton.LeftButton and self.current_box:
+            # Apply the final drag position (move updates are rate-limited)
+            if self.start_point:
+                self._update_drag_rect(event.scenePos())
             rect = self.current_box.rect()
-            
+
             # Only create box if it's large enough (min 5x5 pixels)
             if rect.width() > 5 and rect.height() > 5:
-                # Save current state for undo
-                self.save_state()
-                
-                # Get color (custom or default)
-                color = self.get_box_color(self.current_class_id)
-                
+                # Get color and pens (custom or default, memoized)
+                color, pen_normal, _, _, _ = self._pen_cache_for(self.current_class_id)
+
                 # Create bounding box data object with color
                 bbox = BoundingBox(
-                    rect, 
-                    self.current_class_id, 
+                    rect,
+                    self.current_class_id,
                     self.current_class_name,
                     color
                 )
                 bbox.graphics_item = self.current_box
-                
+                self._item_to_bbox[id(self.current_box)] = bbox
+
                 # Set final appearance (outline only, no fill)
-                pen = QPen(color, 3)  # Thicker pen (3px)
-                self.current_box.setPen(pen)
+                self.current_box.setPen(pen_normal)
                 # No brush - boxes are outline only
                 
                 # Add text label with class name
                 self.add_box_label(self.current_box, self.current_class_name, color)
-                
+
+                # Record the creation for undo (delta, not a snapshot)
+                self.push_command(AddBoxCommand(len(self.boxes), bbox))
                 self.boxes.append(bbox)
-                self.box_created.emit()
+                self._geom_dirty = True
+                self.box_created.emit(bbox)
             else:
                 # Remove tiny box
                 self.removeItem(self.current_box)
@@ -494,15 +911,14 @@ class AnnotationScene(QGraphicsScene):
         """
         # Deselect current box
         if self.selected_box and self.selected_box.graphics_item:
-            color = self.get_box_color(self.selected_box.class_id)
-            pen = QPen(color, 3)  # Thicker pen
-            self.selected_box.graphics_item.setPen(pen)
-        
+            _, pen_normal, _, _, _ = self._pen_cache_for(self.selected_box.class_id)
+            self.selected_box.graphics_item.setPen(pen_normal)
+
         # Select new box
         self.selected_box = bbox
         if bbox and bbox.graphics_item:
-            pen = QPen(QColor(255, 255, 255), 4)  # White highlight, extra thick
-            bbox.graphics_item.setPen(pen)
+            _, _, pen_selected, _, _ = self._pen_cache_for(bbox.class_id)
+            bbox.graphics_item.setPen(pen_selected)
     
     def select_box_by_item(self, item: QGraphicsRectItem):
         """
@@ -513,12 +929,11 @@ class AnnotationScene(QGraphicsScene):
         Args:
             item: The graphics item representing the box
         """
-        for i, bbox in enumerate(self.boxes):
-            if bbox.graphics_item == item:
-                self.select_box(bbox)
-                # Emit signal for list synchronization
-                self.box_selected.emit(bbox)
-                break
+        bbox = self._item_to_bbox.get(id(item))
+        if bbox:
+            self.select_box(bbox)
+            # Emit signal for list synchronization
+            self.box_selected.emit(bbox)
     
     def delete_selected_boxes(self, indices: List[int]):
         """
@@ -527,15 +942,23 @@ class AnnotationScene(QGraphicsScene):
         Args:
             indices: List of indices to delete (sorted descending)
         """
-        self.save_state()
-        
-        for i in sorted(indices, reverse=True):
-            if 0 <= i < len(self.boxes):
-                bbox = self.boxes[i]
-                if bbox.graphics_item:
-                    self.removeItem(bbox.graphics_item)
-                self.boxes.pop(i)
-        
+        valid = sorted(set(i for i in indices if 0 <= i < len(self.boxes)))
+        if not valid:
+            return
+
+        # Record the batched deletion for undo (delta, not a snapshot)
+        removed = [self.boxes[i] for i in valid]
+        self.push_command(DeleteBoxesCommand(valid, removed))
+
+        for i in reversed(valid):
+            bbox = self.boxes[i]
+            if bbox.graphics_item:
+                self._item_to_bbox.pop(id(bbox.graphics_item), None)
+                self.removeItem(bbox.graphics_item)
+                bbox.graphics_item = None
+            self.boxes.pop(i)
+
+        self._geom_dirty = True
         self.selected_box = None
     
     def add_resize_handles(self, bbox: BoundingBox):
@@ -549,34 +972,58 @@ class AnnotationScene(QGraphicsScene):
         """
         if not bbox.graphics_item:
             return
-        
-        # Remove old handles
+
+        # Release any handles currently in use back to the pool
         self.remove_resize_handles()
-        
-        # Create handles at 4 corners
+
+        # Attach pooled handles at 4 corners
         rect = bbox.graphics_item.rect()
-        
+
         positions = [
-            ('top-left', rect.topLeft()),
-            ('top-right', rect.topRight()),
-            ('bottom-left', rect.bottomLeft()),
-            ('bottom-right', rect.bottomRight())
+            rect.topLeft(),
+            rect.topRight(),
+            rect.bottomLeft(),
+            rect.bottomRight()
         ]
-        
-        for position_name, pos in positions:
-            handle = ResizeHandle(position_name, bbox.graphics_item)
+
+        for handle, pos in zip(self._handle_pool, positions):
+            handle.parent_bbox = bbox.graphics_item
             # Parent to box so they move together
             handle.setParentItem(bbox.graphics_item)
             handle.setPos(pos)
+            handle.setVisible(True)
             self.resize_handles.append(handle)
-    
+
     def remove_resize_handles(self):
-        """Remove all resize handles from the scene."""
+        """Hide all resize handles and return them to the pool."""
         for handle in self.resize_handles:
-            if handle.scene() == self:
+            handle.setVisible(False)
+            handle.setParentItem(None)
+            handle.parent_bbox = None
+            # Detach from the scene so scene.clear() cannot delete the
+            # pooled items out from under us
+            if handle.scene() is self:
                 self.removeItem(handle)
         self.resize_handles.clear()
     
+    def _schedule_edit_flush(self):
+        """
+        Schedule a deferred update of resize handles and the box label.
+
+        Multiple mouse events arriving within one event loop turn are
+        coalesced into a single handle/label update via a zero-delay timer.
+        """
+        if not self._edit_flush_scheduled:
+            self._edit_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_edit_updates)
+
+    def _flush_edit_updates(self):
+        """Run the coalesced handle and label update for the edited box."""
+        self._edit_flush_scheduled = False
+        if self.editing_box and self.editing_box.graphics_item:
+            self.update_resize_handles()
+            self.update_box_label(self.editing_box.graphics_item)
+
     def update_resize_handles(self):
         """Update handle positions after box is resized."""
         if self.editing_box and self.editing_box.graphics_item and self.resize_handles:
@@ -606,12 +1053,27 @@ class AnnotationScene(QGraphicsScene):
                 # Get the item's rectangle in scene coordinates
                 item = self.editing_box.graphics_item
                 rect_in_scene = item.mapRectToScene(item.rect())
+
+                # Record the move/resize for undo if geometry changed
+                old_rect = QRectF(self.editing_box.rect)
+                if rect_in_scene != old_rect and self.editing_box in self.boxes:
+                    self.push_command(MutateRectCommand(
+                        self.boxes.index(self.editing_box),
+                        old_rect,
+                        QRectF(rect_in_scene)
+                    ))
+                    self.box_modified.emit()
+
+                # Normalize geometry back onto the rect (item may have moved)
+                item.setPos(0, 0)
+                item.setRect(rect_in_scene)
+                self.update_box_label(item)
                 self.editing_box.rect = rect_in_scene
-                
+                self._geom_dirty = True
+
                 # Reset to normal appearance
-                color = self.get_box_color(self.editing_box.class_id)
-                pen = QPen(color, 3)  # Thicker pen
-                self.editing_box.graphics_item.setPen(pen)
+                _, pen_normal, _, _, _ = self._pen_cache_for(self.editing_box.class_id)
+                self.editing_box.graphics_item.setPen(pen_normal)
                 
                 # Make non-movable
                 self.editing_box.graphics_item.setFlag(
@@ -623,7 +1085,7 @@ class AnnotationScene(QGraphicsScene):
             
             self.editing_box = None
     
-    def add_box_label(self, box_item: QGraphicsRectItem, class_name: str, color: QColor):
+    def add_box_label(self, box_item: BoxGraphicsItem, class_name: str, color: QColor):
         """
         Add a text label showing the class name on the box.
         Label appears in a small box at the top-left corner.
@@ -638,18 +1100,15 @@ class AnnotationScene(QGraphicsScene):
         # Create text item
         text_item = QGraphicsTextItem(class_name)
         # Always use black text
-        text_color = QColor(0, 0, 0)  # Black text
+        text_color = LABEL_TEXT_COLOR  # Black text
         text_item.setDefaultTextColor(text_color)
         
-        # Set font - smaller and bold
-        from PyQt6.QtGui import QFont
-        font = QFont()
+        # Set font - smaller and bold (cached instances, no per-call QFont)
         box_height = box_item.rect().height()
         font_size = int(box_height / 15)
         font_size = max(7, min(font_size, 14))
-        font.setPointSize(font_size)
-        font.setBold(True)
-        text_item.setFont(font)
+        text_item.setFont(self._font_by_size[font_size])
+        box_item.label_font_size = font_size  # Remember applied size for updates
         
         # Get text dimensions
         text_rect = text_item.boundingRect()
@@ -677,45 +1136,48 @@ class AnnotationScene(QGraphicsScene):
         bg_rect.setParentItem(box_item)
         text_item.setParentItem(box_item)
         
-        # Store reference to text item on the box
-        box_item.setData(0, text_item)
-        box_item.setData(1, bg_rect)
-        
+        # Store references to the label items on the box
+        box_item.label_text = text_item
+        box_item.label_bg = bg_rect
+
         return text_item
     
-    def update_box_label(self, box_item: QGraphicsRectItem):
+    def update_box_label(self, box_item: BoxGraphicsItem):
         """
         Update the label position and font size for a box during resize.
         
         Args:
             box_item: The graphics rectangle item whose label needs updating
         """
-        # Get existing label items
-        text_item = box_item.data(0)  # Text item
-        bg_rect = box_item.data(1)    # Background rectangle
-        
+        # Get existing label items (plain attributes, no QVariant boxing)
+        text_item = box_item.label_text
+        bg_rect = box_item.label_bg
+
         if not text_item or not bg_rect:
             return
         
-        # Update font size based on new box height
-        from PyQt6.QtGui import QFont
-        font = QFont()
+        # Update font size based on new box height (cached instances)
         box_height = box_item.rect().height()
         font_size = int(box_height / 15)
         font_size = max(7, min(font_size, 14))
-        font.setPointSize(font_size)
-        font.setBold(True)
-        text_item.setFont(font)
-        
-        # Recalculate text dimensions
-        text_rect = text_item.boundingRect()
         padding = 3
-        
-        # Update background size
-        label_width = text_rect.width() + (padding * 2)
-        label_height = text_rect.height() + (padding * 2)
-        bg_rect.setRect(0, 0, label_width, label_height)
-        
+
+        # The clamped size only changes at discrete height thresholds, so
+        # skip the font swap and text re-layout when it is unchanged
+        if box_item.label_font_size != font_size:
+            box_item.label_font_size = font_size
+            text_item.setFont(self._font_by_size[font_size])
+
+            # Recalculate text dimensions
+            text_rect = text_item.boundingRect()
+
+            # Update background size
+            label_width = text_rect.width() + (padding * 2)
+            label_height = text_rect.height() + (padding * 2)
+            bg_rect.setRect(0, 0, label_width, label_height)
+        else:
+            label_height = bg_rect.rect().height()
+
         # Update positions relative to box
         box_rect = box_item.rect()
         bg_rect.setPos(box_rect.left(), box_rect.top() - label_height)
@@ -724,116 +1186,212 @@ class AnnotationScene(QGraphicsScene):
             box_rect.top() - label_height + padding
         )
     
+    # ========================================================================
+    # GEOMETRY QUERIES
+    # ========================================================================
+
+    def _rebuild_geometry_arrays(self):
+        """Rebuild the SoA geometry mirror from the current boxes."""
+        n = len(self.boxes)
+        geom = np.empty((n, 4), dtype=np.float32)
+        cids = np.empty(n, dtype=np.int32)
+        for i, bbox in enumerate(self.boxes):
+            rect = bbox.rect
+            geom[i, 0] = rect.left()
+            geom[i, 1] = rect.top()
+            geom[i, 2] = rect.right()
+            geom[i, 3] = rect.bottom()
+            cids[i] = bbox.class_id
+        self._geom = geom
+        self._cids = cids
+        self._geom_dirty = False
+
+    def boxes_containing(self, x: float, y: float) -> np.ndarray:
+        """
+        Find all boxes whose rectangle contains a point.
+
+        Tests every box in a single vectorized pass over the SoA geometry
+        columns instead of a Python loop over QRectF objects - useful for
+        dense scenes and range-style queries.
+
+        Args:
+            x: X coordinate in scene space
+            y: Y coordinate in scene space
+
+        Returns:
+            Array of indices into self.boxes, in ascending order
+        """
+        if self._geom_dirty:
+            self._rebuild_geometry_arrays()
+        geom = self._geom
+        mask = ((x >= geom[:, 0]) & (x <= geom[:, 2]) &
+                (y >= geom[:, 1]) & (y <= geom[:, 3]))
+        return np.nonzero(mask)[0]
+
+    # ========================================================================
+    # EXPORT FUNCTIONALITY
+    # ========================================================================
+
+    def export_yolo(self, image_width: int, image_height: int,
+                    indices: Optional[List[int]] = None) -> str:
+        """
+        Export boxes to YOLO format text in one vectorized pass.
+
+        Gathers box geometry into NumPy arrays (structure-of-arrays layout),
+        normalizes and clamps all coordinates at once, and formats the whole
+        label file with a single np.savetxt call. Much faster than calling
+        to_yolo_format per box when exporting many annotations.
+
+        Args:
+            image_width: Width of the image in pixels
+            image_height: Height of the image in pixels
+            indices: Optional list of box indices to export (all if None)
+
+        Returns:
+            YOLO format text, one line per box (empty string if no boxes)
+        """
+        if indices is None:
+            boxes = self.boxes
+        else:
+            boxes = [self.boxes[i] for i in indices if 0 <= i < len(self.boxes)]
+
+        n = len(boxes)
+        if n == 0:
+            return ""
+
+        # Gather geometry into SoA arrays in a single pass over the boxes
+        rects = np.empty((n, 4), dtype=np.float32)  # left, top, right, bottom
+        class_ids = np.empty(n, dtype=np.int32)
+        for i, bbox in enumerate(boxes):
+            rect = bbox.rect
+            rects[i, 0] = rect.left()
+            rects[i, 1] = rect.top()
+            rects[i, 2] = rect.right()
+            rects[i, 3] = rect.bottom()
+            class_ids[i] = bbox.class_id
+
+        # Vectorized center/size computation with normalized coordinates
+        coords = np.empty((n, 4), dtype=np.float32)
+        coords[:, 0] = (rects[:, 0] + rects[:, 2]) * (0.5 / image_width)   # x_center
+        coords[:, 1] = (rects[:, 1] + rects[:, 3]) * (0.5 / image_height)  # y_center
+        coords[:, 2] = (rects[:, 2] - rects[:, 0]) * (1.0 / image_width)   # width
+        coords[:, 3] = (rects[:, 3] - rects[:, 1]) * (1.0 / image_height)  # height
+
+        # Ensure values are within valid range [0, 1]
+        np.clip(coords, 0.0, 1.0, out=coords)
+
+        # Format the whole file in one call
+        buffer = io.StringIO()
+        np.savetxt(
+            buffer,
+            np.column_stack((class_ids, coords)),
+            fmt=YOLO_LINE_FORMAT
+        )
+        return buffer.getvalue()
+
     # ========================================================================
     # UNDO/REDO FUNCTIONALITY
     # ========================================================================
-    
-    def save_state(self):
-        """Save current state for undo functionality."""
-        # Create deep copy of current boxes
-        state = []
-        for bbox in self.boxes:
-            new_bbox = BoundingBox(
-                QRectF(bbox.rect),
-                bbox.class_id,
-                bbox.class_name
-            )
-            state.append(new_bbox)
-        
-        self.undo_stack.append(state)
+
+    def push_command(self, command):
+        """
+        Record an already-performed action for undo.
+
+        Args:
+            command: Command object with apply(scene)/revert(scene) methods
+        """
+        self.undo_stack.append(command)
+        # Bound history so long editing sessions cannot grow without limit
+        if len(self.undo_stack) > self.max_undo_depth:
+            self.undo_stack.pop(0)
         # Clear redo stack when new action is performed
         self.redo_stack.clear()
-    
+
     def undo(self) -> bool:
         """
         Undo last action.
-        
+
         Returns:
             True if undo was successful, False if nothing to undo
         """
         if not self.undo_stack:
             return False
-        
-        # Save current state to redo stack
-        current_state = []
-        for bbox in self.boxes:
-            new_bbox = BoundingBox(
-                QRectF(bbox.rect),
-                bbox.class_id,
-                bbox.class_name
-            )
-            current_state.append(new_bbox)
-        self.redo_stack.append(current_state)
-        
-        # Restore previous state
-        previous_state = self.undo_stack.pop()
-        self.restore_state(previous_state)
-        
+
+        command = self.undo_stack.pop()
+        command.revert(self)
+        self.redo_stack.append(command)
+
         return True
-    
+
     def redo(self) -> bool:
         """
-        Redo last undone action.
-        
-        Returns:
-            True if redo was successful, False if nothing to redo
+        Redo last undone action.
+
+        Returns:
+            True if redo was successful, False if nothing to redo
+        """
+        if not self.redo_stack:
+            return False
+
+        command = self.redo_stack.pop()
+        command.apply(self)
+        self.undo_stack.append(command)
+
+        return True
+
+    def _insert_box(self, index: int, bbox: BoundingBox):
+        """
+        Insert a box at the given index, creating its graphics item.
+
+        Args:
+            index: Position in self.boxes to insert at
+            bbox: The bounding box to insert
+        """
+        new_item = BoxGraphicsItem(bbox.rect)
+        color, pen_normal, _, _, _ = self._pen_cache_for(bbox.class_id)
+        new_item.setPen(pen_normal)
+        # No brush - outline only
+        self.addItem(new_item)
+
+        # Add label
+        self.add_box_label(new_item, bbox.class_name, color)
+
+        bbox.graphics_item = new_item
+        self._item_to_bbox[id(new_item)] = bbox
+        self.boxes.insert(index, bbox)
+        self._geom_dirty = True
+
+    def _remove_box(self, index: int):
         """
-        if not self.redo_stack:
-            return False
-        
-        # Save current state to undo stack
-        current_state = []
-        for bbox in self.boxes:
-            new_bbox = BoundingBox(
-                QRectF(bbox.rect),
-                bbox.class_id,
-                bbox.class_name
-            )
-            current_state.append(new_bbox)
-        self.undo_stack.append(current_state)
-        
-        # Restore redo state
-        redo_state = self.redo_stack.pop()
-        self.restore_state(redo_state)
-        
-        return True
-    
-    def restore_state(self, state: List[BoundingBox]):
+        Remove the box at the given index and its graphics item.
+
+        Args:
+            index: Position in self.boxes to remove
         """
-        Restore scene to a previous state.
-        
+        bbox = self.boxes.pop(index)
+        if bbox.graphics_item:
+            self._item_to_bbox.pop(id(bbox.graphics_item), None)
+            self.removeItem(bbox.graphics_item)
+            bbox.graphics_item = None
+        self._geom_dirty = True
+        if self.selected_box is bbox:
+            self.selected_box = None
+
+    def _set_box_rect(self, index: int, rect: QRectF):
+        """
+        Update the geometry of the box at the given index.
+
         Args:
-            state: List of BoundingBox objects representing the state
+            index: Position in self.boxes to update
+            rect: New rectangle in scene coordinates
         """
-        # Clear current boxes
-        for bbox in self.boxes:
-            if bbox.graphics_item:
-                self.removeItem(bbox.graphics_item)
-        
-        self.boxes.clear()
-        self.selected_box = None
-        
-        # Restore boxes from state
-        for bbox in state:
-            # Create new graphics item
-            new_item = QGraphicsRectItem(bbox.rect)
-            color = self.get_box_color(bbox.class_id)
-            pen = QPen(color, 3)  # Thicker pen
-            new_item.setPen(pen)
-            # No brush - outline only
-            self.addItem(new_item)
-            
-            # Add label
-            self.add_box_label(new_item, bbox.class_name, color)
-            
-            # Create new BoundingBox
-            new_bbox = BoundingBox(
-                QRectF(bbox.rect),
-                bbox.class_id,
-                bbox.class_name
-            )
-            new_bbox.graphics_item = new_item
-            self.boxes.append(new_bbox)
+        bbox = self.boxes[index]
+        bbox.rect = QRectF(rect)
+        self._geom_dirty = True
+        if bbox.graphics_item:
+            bbox.graphics_item.setPos(0, 0)
+            bbox.graphics_item.setRect(bbox.rect)
+            self.update_box_label(bbox.graphics_item)
 
 
 # ============================================================================
@@ -850,7 +1408,11 @@ class ImageView(QGraphicsView):
     - Pan with middle mouse button
     - Fit to window functionality
     """
-    
+
+    # Transform limits - extreme zoom triggers Qt cache/precision issues
+    MIN_ZOOM = 0.05
+    MAX_ZOOM = 20.0
+
     def __init__(self, scene: AnnotationScene, parent=None):
         """
         Initialize the image view.
@@ -860,53 +1422,105 @@ class ImageView(QGraphicsView):
             parent: Parent widget
         """
         super().__init__(scene, parent)
-        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # GPU-accelerated viewport: the image is uploaded once as a texture
+        # and zoom/pan become textured-quad redraws instead of repainting
+        # the full pixmap on the CPU every frame
+        self._gl_viewport = False
+        try:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+            self.setViewport(QOpenGLWidget())
+            # QOpenGLWidget cannot do partial updates
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
+            self._gl_viewport = True
+        except ImportError:
+            # Raster fallback: skip SmartViewportUpdate's dirty-region
+            # analysis and redraw one bounding region per scene change
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
+            )
+
+        # Annotation rectangles are axis-aligned, so antialiasing buys
+        # nothing but nearly doubles raster draw cost; keep only the
+        # smooth transform for the image itself
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing |
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+        )
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
+        # The scene paints the image in drawBackground - cache it so only
+        # the annotation overlay is rerasterized on scene updates
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         
         self.zoom_factor = 1.15
+        # Precomputed zoom levels, one per wheel notch.  Indexing this
+        # table instead of multiplying current_zoom repeatedly keeps the
+        # zoom exact over long in/out sequences (no float drift), and the
+        # table bounds enforce MIN_ZOOM/MAX_ZOOM by construction.
+        self._zoom_steps = tuple(self.zoom_factor ** k for k in range(-21, 22))
+        self._zoom_idx = 21  # Index of the 1.0 entry
         self.current_zoom = 1.0
-        self.panning = False
-        self.pan_start = None
-    
+        self._wheel_accum = 0  # Accumulated angleDelta awaiting one zoom
+        self._wheel_flush_scheduled = False
+        self._shown = False
+    
+    def showEvent(self, event):
+        """Fit the scene on first show - avoids an oversize 1:1 render."""
+        super().showEvent(event)
+        if not self._shown:
+            self._shown = True
+            self.fit_in_view()
+
+    def resizeEvent(self, event):
+        """Keep the image fitted while the user has not zoomed."""
+        super().resizeEvent(event)
+        if self._shown and self.current_zoom == 1.0:
+            self.fit_in_view()
+
+    def _has_content(self):
+        """Return True once an image has been loaded into the scene."""
+        scene = self.scene()
+        return scene is not None and not scene.sceneRect().isEmpty()
+
     def mousePressEvent(self, event):
         """Handle mouse press for panning with middle button."""
-        if event.button() == Qt.MouseButton.MiddleButton:
-            # Start panning with middle mouse button
-            self.panning = True
-            self.pan_start = event.pos()
-            self.setCursor(Qt.CursorShape.ClosedHandCursor)
-            event.accept()
-        else:
-            super().mousePressEvent(event)
-    
-    def mouseMoveEvent(self, event):
-        """Handle mouse move for panning."""
-        if self.panning and self.pan_start:
-            # Pan the view
-            delta = event.pos() - self.pan_start
-            self.pan_start = event.pos()
-            
-            # Update scroll bars
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - delta.x()
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - delta.y()
+        if event.button() == Qt.MouseButton.MiddleButton and self._has_content():
+            # Hand panning off to Qt's built-in ScrollHandDrag, which runs
+            # the whole drag in C++ with no per-event Python dispatch.
+            # It only reacts to the left button, so synthesize one.
+            self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+            fake_press = QMouseEvent(
+                QEvent.Type.MouseButtonPress,
+                event.position(),
+                event.globalPosition(),
+                Qt.MouseButton.LeftButton,
+                Qt.MouseButton.LeftButton,
+                event.modifiers()
             )
+            super().mousePressEvent(fake_press)
             event.accept()
         else:
-            super().mouseMoveEvent(event)
-    
+            super().mousePressEvent(event)
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release to stop panning."""
         if event.button() == Qt.MouseButton.MiddleButton:
-            # Stop panning
-            self.panning = False
-            self.pan_start = None
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+            # End the synthesized left-button drag and restore NoDrag
+            fake_release = QMouseEvent(
+                QEvent.Type.MouseButtonRelease,
+                event.position(),
+                event.globalPosition(),
+                Qt.MouseButton.LeftButton,
+                Qt.MouseButton.NoButton,
+                event.modifiers()
+            )
+            super().mouseReleaseEvent(fake_release)
+            self.setDragMode(QGraphicsView.DragMode.NoDrag)
             event.accept()
         else:
             super().mouseReleaseEvent(event)
@@ -917,35 +1531,119 @@ class ImageView(QGraphicsView):
         
         Hold Ctrl and scroll to zoom in/out.
         """
+        if not self._has_content():
+            # Nothing to zoom or scroll over yet
+            event.accept()
+            return
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            # Zoom with Ctrl + Scroll
-            if event.angleDelta().y() > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
+            # Zoom with Ctrl + Scroll - accumulate deltas and apply one
+            # proportional scale per frame; high-resolution trackpads
+            # otherwise trigger a repaint per sub-notch event
+            self._wheel_accum += event.angleDelta().y()
+            if not self._wheel_flush_scheduled:
+                self._wheel_flush_scheduled = True
+                QTimer.singleShot(16, self._flush_zoom)
         else:
             # Normal scroll
             super().wheelEvent(event)
+
+    def _flush_zoom(self):
+        """Apply the accumulated wheel delta as whole zoom notches."""
+        self._wheel_flush_scheduled = False
+        # 120 units per standard notch; truncate toward zero and keep the
+        # sub-notch remainder so trackpad deltas are not lost
+        steps = int(self._wheel_accum / 120)
+        self._wheel_accum -= steps * 120
+        if steps:
+            self._set_zoom_index(self._zoom_idx + steps)
+
+    def _set_zoom_index(self, idx):
+        """Jump to a precomputed zoom level, clamped to the table bounds."""
+        idx = min(max(idx, 0), len(self._zoom_steps) - 1)
+        if idx == self._zoom_idx:
+            return
+        target = self._zoom_steps[idx]
+        factor = target / self.current_zoom
+        self.scale(factor, factor)
+        self._zoom_idx = idx
+        self.current_zoom = target
+        self._update_smoothing()
+
+    def _update_smoothing(self):
+        """
+        Match pixmap smoothing to the zoom level.
+
+        Bilinear sampling during heavy minification reads every source
+        pixel per frame for no visible benefit, so drop it below 0.5x.
+        """
+        self.setRenderHint(
+            QPainter.RenderHint.SmoothPixmapTransform,
+            self.current_zoom > 0.5
+        )
     
     def zoom_in(self):
-        """Zoom in by factor."""
-        self.scale(self.zoom_factor, self.zoom_factor)
-        self.current_zoom *= self.zoom_factor
-    
+        """Zoom in one notch (no-op at the maximum zoom)."""
+        self._set_zoom_index(self._zoom_idx + 1)
+
     def zoom_out(self):
-        """Zoom out by factor."""
-        self.scale(1 / self.zoom_factor, 1 / self.zoom_factor)
-        self.current_zoom /= self.zoom_factor
+        """Zoom out one notch (no-op at the minimum zoom)."""
+        self._set_zoom_index(self._zoom_idx - 1)
     
     def fit_in_view(self):
         """Fit the entire scene in the view."""
-        self.fitInView(self.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        # Use the scene's cached image bounds - no item-index walk
+        scene = self.scene()
+        if isinstance(scene, AnnotationScene) and not scene._cached_scene_rect.isNull():
+            rect = scene._cached_scene_rect
+        else:
+            rect = self.sceneRect()
+        self.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
         self.current_zoom = 1.0
-    
+        self._zoom_idx = 21
+        self._update_smoothing()
+
     def reset_zoom(self):
         """Reset zoom to 100%."""
         self.resetTransform()
         self.current_zoom = 1.0
+        self._zoom_idx = 21
+        self._update_smoothing()
+
+
+# ============================================================================
+# IMAGE PREFETCH WORKER
+# ============================================================================
+
+class ImagePrefetchTask(QRunnable):
+    """
+    Decode one image off the GUI thread into a shared prefetch cache.
+
+    Navigation is sequential, so decoding the neighbors of the current
+    image in the background hides the 50-300 ms JPEG decode behind the
+    user's think-time. Only the QImage decode runs here; the QPixmap
+    conversion happens on the GUI thread when the image is shown.
+    """
+
+    def __init__(self, path: Path, view_size: QSize, cache: OrderedDict,
+                 pending: set, lock: threading.Lock, max_entries: int = 4):
+        super().__init__()
+        self.path = path
+        self.view_size = view_size
+        self.cache = cache
+        self.pending = pending
+        self.lock = lock
+        self.max_entries = max_entries
+
+    def run(self):
+        decoded = AnnotationScene.decode_image(self.path, self.view_size)
+        with self.lock:
+            self.pending.discard(self.path)
+            if decoded is not None:
+                self.cache[self.path] = decoded
+                self.cache.move_to_end(self.path)
+                # Small LRU - evict the oldest decodes
+                while len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
 
 
 # ============================================================================
@@ -975,22 +1673,45 @@ class MainWindow(QMainWindow):
         
         # File paths and state
         self.image_files: List[Path] = []
+        self.image_file_index: dict = {}  # Path -> position in image_files
         self.current_image_index: int = 0
         self.current_image_path: Optional[Path] = None
         self.image_directory: Optional[Path] = None
         self.labels_directory: Optional[Path] = None
+        self._label_set: Optional[set] = None  # stems with a .txt sidecar
         self.class_file_path: Optional[Path] = None
         self.unsaved_changes: bool = False
+        self.auto_save_on_switch: bool = True
         
         # Classes management
         self.classes: List[str] = []  # For backwards compatibility and display
         self.class_id_map: dict = {}  # Maps class_id (int) -> class_name (str) - allows arbitrary IDs
+        self._sorted_class_ids: List[int] = []  # class_id_map keys, kept sorted
+        self._name_to_id: dict = {}  # class_name -> class_id reverse index
+        self._box_index: dict = {}  # id(bbox) -> row in annotations list
+        self._last_selected: set = set()  # rows highlighted by the last selection
+        self._selchange_scheduled: bool = False  # pending selection recompute
+        self._row_text_cache: dict = {}  # (row, class_id, class_name) -> row text
+
+        # Background prefetch of neighboring images (see ImagePrefetchTask)
+        self._prefetch_cache: OrderedDict = OrderedDict()
+        self._prefetch_pending: set = set()
+        self._prefetch_lock = threading.Lock()
+
+        # Deferred sidecar parsing - scrubbing through a directory with
+        # next/prev held down should pay decode cost only; annotations
+        # are parsed once navigation settles (see load_image)
+        self._annotation_timer = QTimer(self)
+        self._annotation_timer.setSingleShot(True)
+        self._annotation_timer.setInterval(100)
+        self._annotation_timer.timeout.connect(self.load_annotations)
         self.class_colors: dict = {}  # class_id -> QColor mapping
         
-        # Setup UI components
+        # Setup UI components - only the File menu is wired before first
+        # paint; the View menu and editing shortcuts install right after
+        self._deferred_actions_installed = False
         self.setup_ui()
         self.setup_menu()
-        self.setup_shortcuts()
         self.setup_connections()
         
         # Set initial status
@@ -1142,6 +1863,13 @@ class MainWindow(QMainWindow):
         save_action.setShortcut(QKeySequence("Ctrl+S"))
         save_action.triggered.connect(self.save_annotations)
         file_menu.addAction(save_action)
+
+        # Auto-save on image switch
+        auto_save_action = QAction("Auto-save on Image S&witch", self)
+        auto_save_action.setCheckable(True)
+        auto_save_action.setChecked(self.auto_save_on_switch)
+        auto_save_action.toggled.connect(self.set_auto_save_on_switch)
+        file_menu.addAction(auto_save_action)
         
         # Change Label Directory
         change_labels_dir_action = QAction("Change &Label Directory...", self)
@@ -1171,23 +1899,40 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
+    def showEvent(self, event):
+        """Finish action wiring after the window is first painted."""
+        super().showEvent(event)
+        if not self._deferred_actions_installed:
+            self._deferred_actions_installed = True
+            QTimer.singleShot(0, self._install_deferred_actions)
+
+    def _install_deferred_actions(self):
+        """
+        Install the View menu and editing shortcuts.
+
+        QAction construction and QKeySequence parsing are pure startup
+        cost, so everything not needed to open a file is deferred until
+        one event-loop tick after the first paint.
+        """
         # ====================================================================
         # VIEW MENU
         # ====================================================================
-        view_menu = menubar.addMenu("&View")
-        
+        view_menu = self.menuBar().addMenu("&View")
+
         # Fit to Window
         fit_view_action = QAction("&Fit to Window", self)
         fit_view_action.setShortcut(QKeySequence("F"))
         fit_view_action.triggered.connect(self.view.fit_in_view)
         view_menu.addAction(fit_view_action)
-        
+
         # Reset Zoom
         reset_zoom_action = QAction("&Reset Zoom", self)
         reset_zoom_action.setShortcut(QKeySequence("R"))
         reset_zoom_action.triggered.connect(self.view.reset_zoom)
         view_menu.addAction(reset_zoom_action)
-    
+
+        self.setup_shortcuts()
+
     def setup_shortcuts(self):
         """Set up keyboard shortcuts for quick actions."""
         # Undo
@@ -1223,6 +1968,7 @@ class MainWindow(QMainWindow):
         self.annotations_list.itemSelectionChanged.connect(self.on_selection_changed)
         self.scene.box_created.connect(self.on_box_created)
         self.scene.box_selected.connect(self.on_box_selected_in_viewer)
+        self.scene.box_modified.connect(self.on_box_modified)
     
     # ========================================================================
     # EVENT HANDLERS
@@ -1251,7 +1997,7 @@ class MainWindow(QMainWindow):
     def on_class_changed(self, index: int):
         """Handle class selection change."""
         # Get the sorted list of class IDs to find which one was selected
-        sorted_ids = sorted(self.class_id_map.keys())
+        sorted_ids = self._sorted_class_ids
         if 0 <= index < len(sorted_ids):
             class_id = sorted_ids[index]
             class_name = self.class_id_map[class_id]
@@ -1260,58 +2006,137 @@ class MainWindow(QMainWindow):
             self.scene.set_current_class(class_id, class_name, color)
             self.statusBar().showMessage(f"Current class: [{class_id}] {class_name}")
     
-    def on_box_created(self):
+    def on_box_created(self, bbox: BoundingBox):
         """Handle new box creation."""
-        self.refresh_annotations_list()
+        # The new box is always appended, so add just its row instead of
+        # rebuilding the whole list; full rebuilds stay on the delete/
+        # undo/redo paths where indices shift
+        row = len(self.scene.boxes) - 1
+        text = f"[{row}] {bbox.class_name} (class {bbox.class_id})"
+        self.annotations_list.addItem(text)
+        self._row_text_cache[(row, bbox.class_id, bbox.class_name)] = text
+        self._box_index[id(bbox)] = row
         self.unsaved_changes = True
-    
+
+    def on_box_modified(self):
+        """Mark the image dirty when a box is moved or resized."""
+        self.unsaved_changes = True
+
     def on_annotation_selected(self, index: int):
         """Handle annotation selection from list."""
         pass  # Using on_selection_changed instead
     
     def on_selection_changed(self):
+        """Coalesce selection-changed bursts into one recompute per tick."""
+        # Rubber-band drags emit itemSelectionChanged once per row the
+        # cursor crosses; defer the retint so a burst within one event-
+        # loop tick is handled once
+        if not self._selchange_scheduled:
+            self._selchange_scheduled = True
+            QTimer.singleShot(0, self._apply_selection_change)
+
+    def _apply_selection_change(self):
         """Handle selection changes in annotations list - sync with viewer."""
+        self._selchange_scheduled = False
         # Get all selected indices
         selected_rows = self.annotations_list.selectedIndexes()
         selected_indices = set(idx.row() for idx in selected_rows)
-        
-        # Clear all highlights first
-        for bbox in self.scene.boxes:
-            if bbox.graphics_item:
-                color = self.scene.get_box_color(bbox.class_id)
-                pen = QPen(color, 3)  # Thicker pen
-                bbox.graphics_item.setPen(pen)
-        
-        # Highlight all selected boxes
-        for idx in selected_indices:
-            if 0 <= idx < len(self.scene.boxes):
-                bbox = self.scene.boxes[idx]
+
+        # Re-pen only the boxes that entered or left the selection; most
+        # events toggle one row, so this is O(delta) not O(boxes).
+        # Pens come from the scene's cache rather than being allocated.
+        # Bind the loop lookups to locals - LOAD_FAST vs attribute probes.
+        boxes = self.scene.boxes
+        count = len(boxes)
+        pens_for = self.scene._pen_cache_for
+        for idx in self._last_selected - selected_indices:
+            if 0 <= idx < count:
+                bbox = boxes[idx]
+                if bbox.graphics_item:
+                    bbox.graphics_item.setPen(pens_for(bbox.class_id)[1])
+
+        for idx in selected_indices - self._last_selected:
+            if 0 <= idx < count:
+                bbox = boxes[idx]
                 if bbox.graphics_item:
-                    pen = QPen(QColor(255, 255, 255), 4)  # White highlight, extra thick
-                    bbox.graphics_item.setPen(pen)
+                    bbox.graphics_item.setPen(pens_for(bbox.class_id)[2])
+
+        self._last_selected = selected_indices
     
     def on_box_selected_in_viewer(self, bbox: BoundingBox):
         """Handle box selection from viewer - sync with annotations list."""
-        # Find the index of this box
-        for i, b in enumerate(self.scene.boxes):
-            if b == bbox:
-                # Highlight this item in the annotations list
-                self.annotations_list.setCurrentRow(i)
-                break
+        # O(1) identity lookup instead of scanning scene.boxes per click
+        row = self._box_index.get(id(bbox))
+        if row is not None:
+            self.annotations_list.setCurrentRow(row)
     
     def on_file_double_clicked(self, item: QListWidgetItem):
         """Handle double-click on file in list."""
         index = self.files_list.row(item)
         if 0 <= index < len(self.image_files):
             self.current_image_index = index
-            self.load_image(self.image_files[index])
+            self.load_image(self.image_files[index], index)
     
     def refresh_annotations_list(self):
         """Update the annotations list widget."""
-        self.annotations_list.clear()
-        for i, bbox in enumerate(self.scene.boxes):
-            item_text = f"[{i}] {bbox.class_name} (class {bbox.class_id})"
-            self.annotations_list.addItem(item_text)
+        # Build all rows up front and insert them with one addItems call;
+        # per-item addItem emits a model signal and relayout per box.
+        # Most rows are unchanged between rebuilds, so reuse their strings.
+        boxes = self.scene.boxes
+        cache = self._row_text_cache
+        cache_get = cache.get
+        texts = []
+        append = texts.append
+        for i, bbox in enumerate(boxes):
+            key = (i, bbox.class_id, bbox.class_name)
+            text = cache_get(key)
+            if text is None:
+                text = f"[{i}] {bbox.class_name} (class {bbox.class_id})"
+                cache[key] = text
+            append(text)
+        # Bound the cache so stale rows from earlier images don't pile up
+        if len(cache) > 4 * len(texts) + 64:
+            cache.clear()
+            cache.update(zip(
+                ((i, b.class_id, b.class_name) for i, b in enumerate(boxes)),
+                texts
+            ))
+        self.annotations_list.setUpdatesEnabled(False)
+        self.annotations_list.blockSignals(True)
+        try:
+            self.annotations_list.clear()
+            self.annotations_list.addItems(texts)
+        finally:
+            self.annotations_list.blockSignals(False)
+            self.annotations_list.setUpdatesEnabled(True)
+        # Rows shifted, so rebuild the identity -> row lookup with them
+        self._box_index = {id(b): i for i, b in enumerate(boxes)}
+        # clear() dropped the selection with signals blocked, so reset
+        # any remaining highlights here and start the delta tracking fresh
+        if self._last_selected:
+            pens_for = self.scene._pen_cache_for
+            for bbox in boxes:
+                if bbox.graphics_item:
+                    bbox.graphics_item.setPen(pens_for(bbox.class_id)[1])
+            self._last_selected = set()
+
+    def _refresh_classes_list(self, sorted_ids):
+        """
+        Rebuild the classes list widget in one batched update.
+
+        Signals stay blocked for the whole rebuild - clear() and the
+        first insert would otherwise each fire currentRowChanged, and
+        every firing re-resolves the scene's current class. Callers
+        restore the selection with one explicit setCurrentRow afterwards.
+        """
+        texts = [f"[{cid}] {self.class_id_map[cid]}" for cid in sorted_ids]
+        self.classes_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.classes_list):
+                self.classes_list.clear()
+                self.classes_list.addItems(texts)
+        finally:
+            self.classes_list.setUpdatesEnabled(True)
     
     # ========================================================================
     # CLASS MANAGEMENT
@@ -1333,7 +2158,7 @@ class MainWindow(QMainWindow):
         class_name = class_name.strip()
         
         # Check if class already exists
-        if class_name in self.class_id_map.values():
+        if class_name in self._name_to_id:
             QMessageBox.warning(
                 self, "Duplicate Class",
                 f"Class '{class_name}' already exists."
@@ -1353,7 +2178,7 @@ class MainWindow(QMainWindow):
         
         # Get custom color
         color = QColorDialog.getColor(
-            initial=QColor(0, 255, 0),  # Default green
+            initial=DEFAULT_NEW_CLASS_COLOR,
             parent=self,
             title=f"Choose color for '{class_name}'"
         )
@@ -1363,22 +2188,28 @@ class MainWindow(QMainWindow):
             color = self.scene.get_box_color(class_id)
         
         # Add class to the ID map (allows arbitrary IDs)
+        if class_id not in self.class_id_map:
+            bisect.insort(self._sorted_class_ids, class_id)
+        else:
+            # Reusing an existing ID replaces its old name
+            self._name_to_id.pop(self.class_id_map[class_id], None)
         self.class_id_map[class_id] = class_name
-        
+        self._name_to_id[class_name] = class_id
+
         # Update classes list for backwards compatibility
         # We'll rebuild it sorted by class_id for display
-        sorted_ids = sorted(self.class_id_map.keys())
+        sorted_ids = self._sorted_class_ids
         self.classes = [self.class_id_map[cid] for cid in sorted_ids]
         
         # Store custom color
         self.class_colors[class_id] = color
         self.scene.set_class_color(class_id, color)
         
-        # Refresh classes list display with actual class IDs
-        self.classes_list.clear()
-        for cid in sorted_ids:
-            self.classes_list.addItem(f"[{cid}] {self.class_id_map[cid]}")
-        
+        # Refresh classes list display with actual class IDs, then select
+        # the new class - the one currentRowChanged this rebuild emits
+        self._refresh_classes_list(sorted_ids)
+        self.classes_list.setCurrentRow(bisect.bisect_left(sorted_ids, class_id))
+
         self.statusBar().showMessage(f"Added class: {class_name} with ID {class_id}")
     
     def remove_class(self):
@@ -1386,7 +2217,7 @@ class MainWindow(QMainWindow):
         current_row = self.classes_list.currentRow()
         
         # Get sorted class IDs to find which one is selected
-        sorted_ids = sorted(self.class_id_map.keys())
+        sorted_ids = self._sorted_class_ids
         if current_row < 0 or current_row >= len(sorted_ids):
             QMessageBox.information(
                 self, "No Selection",
@@ -1397,10 +2228,13 @@ class MainWindow(QMainWindow):
         class_id = sorted_ids[current_row]
         class_name = self.class_id_map[class_id]
         
-        # Check if class is in use
-        in_use = any(bbox.class_id == class_id for bbox in self.scene.boxes)
-        
-        if in_use:
+        # One pass collects the affected boxes and answers the in-use check
+        indices_to_remove = [
+            i for i, bbox in enumerate(self.scene.boxes)
+            if bbox.class_id == class_id
+        ]
+
+        if indices_to_remove:
             reply = QMessageBox.question(
                 self, "Class In Use",
                 f"Class '{class_name}' is being used by annotations.\n"
@@ -1411,30 +2245,24 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.StandardButton.No:
                 return
-            
+
             # Remove boxes with this class
-            indices_to_remove = [
-                i for i, bbox in enumerate(self.scene.boxes)
-                if bbox.class_id == class_id
-            ]
-            
-            if indices_to_remove:
-                self.scene.delete_selected_boxes(indices_to_remove)
+            self.scene.delete_selected_boxes(indices_to_remove)
         
         # Remove class from map
         del self.class_id_map[class_id]
-        
+        self._sorted_class_ids.remove(class_id)
+        self._name_to_id.pop(class_name, None)
+
         # Rebuild classes list
-        sorted_ids = sorted(self.class_id_map.keys())
+        sorted_ids = self._sorted_class_ids
         self.classes = [self.class_id_map[cid] for cid in sorted_ids]
         
         # Note: We don't update class IDs of other boxes since IDs can be arbitrary
         
         # Refresh UI
-        self.classes_list.clear()
-        for cid in sorted_ids:
-            self.classes_list.addItem(f"[{cid}] {self.class_id_map[cid]}")
-        
+        self._refresh_classes_list(sorted_ids)
+
         # Select first class if any remain
         if self.classes:
             self.classes_list.setCurrentRow(0)
@@ -1451,8 +2279,7 @@ class MainWindow(QMainWindow):
         
         try:
             with open(self.class_file_path, 'w') as f:
-                for class_name in self.classes:
-                    f.write(class_name + '\n')
+                f.write("".join(name + '\n' for name in self.classes))
         except Exception as e:
             QMessageBox.warning(
                 self, "Warning",
@@ -1479,7 +2306,8 @@ class MainWindow(QMainWindow):
             self,
             "Save Classes File",
             str(default_path),
-            "Text Files (*.txt);;All Files (*)"
+            "Text Files (*.txt);;All Files (*)",
+            options=QFileDialog.Option.DontUseNativeDialog
         )
         
         if not file_path:
@@ -1487,8 +2315,10 @@ class MainWindow(QMainWindow):
         
         try:
             with open(file_path, 'w') as f:
-                for i, class_name in enumerate(self.classes):
-                    f.write(f"[{i}] {class_name}\n")
+                f.write("".join(
+                    f"[{i}] {class_name}\n"
+                    for i, class_name in enumerate(self.classes)
+                ))
             
             # Update class file path
             self.class_file_path = Path(file_path)
@@ -1516,36 +2346,39 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            with open(self.class_file_path, 'r') as f:
-                lines = [line.strip() for line in f if line.strip()]
-            
+            # One read, one splitlines - no per-line file-object iteration
+            text = self.class_file_path.read_text()
+            lines = [s for s in (line.strip() for line in text.splitlines()) if s]
+
             # Clear existing classes
             self.classes = []
             self.class_id_map = {}
-            
+            self._sorted_class_ids = []
+            self._name_to_id = {}
+
             # Parse each line - could be just name or "[id] name"
             for i, line in enumerate(lines):
-                if line.startswith('[') and ']' in line:
+                match = CLASS_LINE_PATTERN.match(line)
+                if match:
                     # Format: [id] name
-                    bracket_end = line.index(']')
-                    class_id = int(line[1:bracket_end])
-                    class_name = line[bracket_end+1:].strip()
+                    class_id = int(match.group(1))
+                    class_name = match.group(2).strip()
                 else:
                     # Format: just name (use sequential ID)
                     class_id = i
                     class_name = line
-                
+
                 self.class_id_map[class_id] = class_name
             
-            # Rebuild classes list sorted by ID
-            sorted_ids = sorted(self.class_id_map.keys())
+            # Rebuild classes list sorted by ID (one sort per file load)
+            self._sorted_class_ids = sorted(self.class_id_map.keys())
+            self._name_to_id = {name: cid for cid, name in self.class_id_map.items()}
+            sorted_ids = self._sorted_class_ids
             self.classes = [self.class_id_map[cid] for cid in sorted_ids]
             
             # Refresh classes list display
-            self.classes_list.clear()
-            for cid in sorted_ids:
-                self.classes_list.addItem(f"[{cid}] {self.class_id_map[cid]}")
-            
+            self._refresh_classes_list(sorted_ids)
+
             if self.classes:
                 self.classes_list.setCurrentRow(0)
                 
@@ -1598,9 +2431,9 @@ class MainWindow(QMainWindow):
                 bbox.graphics_item.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsMovable, True)
                 bbox.graphics_item.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
                 
-                # Highlight with thicker border
-                pen = QPen(QColor(255, 255, 0), 4)  # Yellow thick border
-                bbox.graphics_item.setPen(pen)
+                # Highlight with thicker border (cached edit pen)
+                _, _, _, pen_edit, _ = self.scene._pen_cache_for(bbox.class_id)
+                bbox.graphics_item.setPen(pen_edit)
                 
                 # Mark as being edited
                 self.scene.editing_box = bbox
@@ -1644,7 +2477,9 @@ class MainWindow(QMainWindow):
         if not self.current_image_path:
             QMessageBox.warning(self, "No Image", "No image is currently loaded.")
             return
-        
+
+        self._flush_pending_annotation_load()
+
         # FIRST TIME ONLY: Ask user to choose directory
         if not self.labels_directory:
             QMessageBox.information(
@@ -1690,17 +2525,17 @@ class MainWindow(QMainWindow):
         annotation_path = self.labels_directory / f"{self.current_image_path.stem}.txt"
         
         try:
-            # Write annotations to file
+            # Write annotations to file (vectorized batch export)
             with open(annotation_path, 'w') as f:
-                for i in boxes_to_export:
-                    if i < len(self.scene.boxes):
-                        bbox = self.scene.boxes[i]
-                        yolo_line = bbox.to_yolo_format(
-                            self.scene.image_width,
-                            self.scene.image_height
-                        )
-                        f.write(yolo_line + '\n')
-            
+                f.write(self.scene.export_yolo(
+                    self.scene.image_width,
+                    self.scene.image_height,
+                    indices=boxes_to_export
+                ))
+
+            if self._label_set is not None:
+                self._label_set.add(self.current_image_path.stem)
+
             # Silent success - just update status bar
             self.statusBar().showMessage(
                 f"Exported {len(boxes_to_export)} annotation(s) → {self.labels_directory.name}/"
@@ -1718,134 +2553,232 @@ class MainWindow(QMainWindow):
     
     def open_image(self):
         """Open a single image file."""
+        # The Qt dialog does not generate thumbnails, so it stays snappy
+        # in folders holding thousands of images; start it in the last
+        # used directory rather than letting it scan a default location
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Image",
-            "",
-            "Images (*.png *.jpg *.jpeg *.bmp *.pbm *.tif *.tiff);;All Files (*)"
+            str(self.image_directory) if self.image_directory else "",
+            "Images (*.png *.jpg *.jpeg *.bmp *.pbm *.tif *.tiff);;All Files (*)",
+            options=QFileDialog.Option.DontUseNativeDialog
         )
         
         if file_path:
             image_path = Path(file_path)
             self.image_directory = image_path.parent
+            # The sidecar index was built for the previous directory; a
+            # stale one here would make load_annotations skip this
+            # image's existing label file
+            self._rebuild_label_index()
             self.image_files = [image_path]
+            self.image_file_index = {image_path: 0}
             self.current_image_index = 0
-            self.load_image(image_path)
+            self.load_image(image_path, 0)
     
     def open_directory(self):
         """Open a directory containing images."""
         dir_path = QFileDialog.getExistingDirectory(
             self,
-            "Select Image Directory"
+            "Select Image Directory",
+            str(self.image_directory) if self.image_directory else "",
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontUseNativeDialog
         )
         
         if dir_path:
             directory = Path(dir_path)
             self.image_directory = directory
             self.load_image_directory(directory)
-            
-            # Load classes if available
-            classes_file = directory / "classes.txt"
-            if classes_file.exists():
-                self.class_file_path = classes_file
-                self.load_classes()
+
+            # Classes discovery costs a stat plus a file read - on slow
+            # or network mounts that delays the first image, so run it
+            # one event-loop tick after the image is up
+            QTimer.singleShot(0, lambda: self._load_classes_from(directory))
+
+    def _load_classes_from(self, directory: Path):
+        """Pick up classes.txt from the directory if one exists."""
+        classes_file = directory / "classes.txt"
+        if classes_file.exists():
+            self.class_file_path = classes_file
+            self.load_classes()
     
     def load_image_directory(self, directory: Path):
         """Load all images from a directory."""
-        # Find all image files - use set to avoid duplicates
-        extensions = [
-            '*.png', '*.jpg', '*.jpeg', '*.bmp', '*.pbm', '*.tif', '*.tiff',
-            '*.PNG', '*.JPG', '*.JPEG', '*.BMP', '*.PBM', '*.TIF', '*.TIFF'
-        ]
-        image_files_set = set()
-        for ext in extensions:
-            for file in directory.glob(ext):
-                image_files_set.add(file)
-        
-        self.image_files = sorted(list(image_files_set))
-        
+        # Reuse the previous scan when the directory has not changed -
+        # reopening a large folder is then O(1) instead of a full rescan
+        key = directory.resolve()
+        try:
+            mtime_ns = key.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = _dir_listing_cache.get(key)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            names = cached[1]
+        else:
+            # One scandir pass with a case-insensitive suffix check
+            # replaces a glob per extension/case pair; Path objects are
+            # built only for the names that actually match
+            with os.scandir(directory) as it:
+                names = [
+                    entry.name for entry in it
+                    if entry.is_file(follow_symlinks=False)
+                    and entry.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS
+                ]
+            names.sort()
+            if mtime_ns is not None:
+                _dir_listing_cache[key] = (mtime_ns, names)
+        self.image_files = [directory / name for name in names]
+        self.image_file_index = {p: i for i, p in enumerate(self.image_files)}
+
         if not self.image_files:
             QMessageBox.warning(
                 self, "No Images",
                 f"No image files found in: {directory}"
             )
             return
-        
-        # Update files list
-        self.files_list.clear()
-        for img_file in self.image_files:
-            self.files_list.addItem(img_file.name)
-        
+
+        # Update files list in one batched insert, with repaints and any
+        # sorting suspended so the rebuild costs a single relayout
+        self.files_list.setUpdatesEnabled(False)
+        sorting = self.files_list.isSortingEnabled()
+        self.files_list.setSortingEnabled(False)
+        try:
+            self.files_list.clear()
+            self.files_list.addItems(names)
+        finally:
+            self.files_list.setSortingEnabled(sorting)
+            self.files_list.setUpdatesEnabled(True)
+
+        # Index the sidecar files once for this directory
+        self._rebuild_label_index()
+
         # Load first image
         self.current_image_index = 0
-        self.load_image(self.image_files[0])
+        self.load_image(self.image_files[0], 0)
         
         self.statusBar().showMessage(f"Loaded {len(self.image_files)} images from {directory.name}")
     
-    def load_image(self, image_path: Path):
-        """Load and display an image."""
-        # Ask user if they want to save current annotations before switching
+    def set_auto_save_on_switch(self, enabled: bool):
+        """Toggle silent label saving when navigating between images."""
+        self.auto_save_on_switch = enabled
+
+    def load_image(self, image_path: Path, index: Optional[int] = None):
+        """
+        Load and display an image.
+
+        Args:
+            image_path: Path to the image (callers should pass the exact
+                object stored in image_files, not a reconstructed Path)
+            index: Position of the image in image_files, when the caller
+                already knows it - skips the lookup entirely
+        """
+        # Persist the current image's boxes before switching. The modal
+        # prompt stalls rapid navigation, so by default the sidecar is
+        # written silently; the File menu checkbox restores the prompt.
         if self.current_image_path and len(self.scene.boxes) > 0:
-            reply = QMessageBox.question(
-                self, "Save Annotations?",
-                f"You have {len(self.scene.boxes)} annotation(s) on the current image.\n\n"
-                f"Do you want to export them before loading the new image?",
-                QMessageBox.StandardButton.Yes | 
-                QMessageBox.StandardButton.No | 
-                QMessageBox.StandardButton.Cancel
-            )
-            
-            if reply == QMessageBox.StandardButton.Cancel:
-                # User cancelled - don't load new image
+            if self.auto_save_on_switch:
+                # Only rewrite the sidecar if something actually changed;
+                # plain navigation through an annotated set must not churn
+                # every label file it passes over
+                if self.unsaved_changes:
+                    self.save_annotations()
+            else:
+                reply = QMessageBox.question(
+                    self, "Save Annotations?",
+                    f"You have {len(self.scene.boxes)} annotation(s) on the current image.\n\n"
+                    f"Do you want to export them before loading the new image?",
+                    QMessageBox.StandardButton.Yes |
+                    QMessageBox.StandardButton.No |
+                    QMessageBox.StandardButton.Cancel
+                )
+
+                if reply == QMessageBox.StandardButton.Cancel:
+                    # User cancelled - don't load new image
+                    return
+                elif reply == QMessageBox.StandardButton.Yes:
+                    # User wants to save - prompt for export
+                    self.export_current_annotations()
+        
+        # Suspend repaints for the whole transition - the image swap,
+        # view refit, list clear and selection update would each schedule
+        # a paint; with updates off Qt coalesces them into one
+        self.setUpdatesEnabled(False)
+        try:
+            # Reuse a prefetched decode when the background worker got
+            # there first, otherwise decode synchronously via QImageReader
+            with self._prefetch_lock:
+                decoded = self._prefetch_cache.pop(image_path, None)
+            if not self.scene.set_image_from_path(
+                    image_path, self.view.viewport().size(), decoded=decoded):
+                QMessageBox.critical(
+                    self, "Error",
+                    f"Failed to load image: {image_path}"
+                )
                 return
-            elif reply == QMessageBox.StandardButton.Yes:
-                # User wants to save - prompt for export
-                self.export_current_annotations()
-        
-        pixmap = QPixmap(str(image_path))
-        if pixmap.isNull():
-            QMessageBox.critical(
-                self, "Error",
-                f"Failed to load image: {image_path}"
-            )
+
+            self.current_image_path = image_path
+            self.view.fit_in_view()
+
+            # Clear annotations list for new image
+            self.annotations_list.clear()
+
+            # Load existing annotations once the user dwells on this
+            # image; restarting the timer cancels the parse queued for
+            # the image that was scrubbed past
+            self._annotation_timer.start()
+
+            # Reset unsaved changes flag
+            self.unsaved_changes = False
+
+            # Update info
+            self.update_info_label()
+
+            # Update file list selection - callers that know the position
+            # pass it in; otherwise one dict lookup
+            row = index if index is not None else self.image_file_index.get(image_path)
+            if row is not None:
+                self.files_list.setCurrentRow(row)
+
+            # Update status
+            if self.image_files:
+                status = f"Image {self.current_image_index + 1}/{len(self.image_files)}: {image_path.name}"
+            else:
+                status = f"Loaded: {image_path.name}"
+            self.statusBar().showMessage(status)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+        # Start decoding the neighbors while the user works on this image
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Queue background decodes of the adjacent images."""
+        count = len(self.image_files)
+        if count < 2:
             return
-        
-        self.current_image_path = image_path
-        self.scene.set_image(pixmap)
-        self.view.fit_in_view()
-        
-        # Clear annotations list for new image
-        self.annotations_list.clear()
-        
-        # Load existing annotations if available
-        self.load_annotations()
-        
-        # Reset unsaved changes flag
-        self.unsaved_changes = False
-        
-        # Update info
-        self.update_info_label()
-        
-        # Update file list selection
-        if self.image_files:
-            for i, img_file in enumerate(self.image_files):
-                if img_file == image_path:
-                    self.files_list.setCurrentRow(i)
-                    break
-        
-        # Update status
-        if self.image_files:
-            status = f"Image {self.current_image_index + 1}/{len(self.image_files)}: {image_path.name}"
-        else:
-            status = f"Loaded: {image_path.name}"
-        self.statusBar().showMessage(status)
+        view_size = self.view.viewport().size()
+        for offset in (1, -1):
+            path = self.image_files[(self.current_image_index + offset) % count]
+            with self._prefetch_lock:
+                if path in self._prefetch_cache or path in self._prefetch_pending:
+                    continue
+                self._prefetch_pending.add(path)
+            QThreadPool.globalInstance().start(ImagePrefetchTask(
+                path, view_size,
+                self._prefetch_cache, self._prefetch_pending,
+                self._prefetch_lock
+            ))
     
     def update_info_label(self):
         """Update the image info label."""
         if self.current_image_path:
-            pixmap = QPixmap(str(self.current_image_path))
+            # The scene already read the original dimensions from the
+            # image header during load - re-decoding the file here just
+            # to ask its size would repeat the full pixel decode
             info = f"Image: {self.current_image_path.name}\n"
-            info += f"Size: {pixmap.width()} × {pixmap.height()}"
+            info += f"Size: {self.scene.source_width} × {self.scene.source_height}"
             self.info_label.setText(info)
         else:
             self.info_label.setText("No image loaded")
@@ -1856,7 +2789,8 @@ class MainWindow(QMainWindow):
             return
         
         self.current_image_index = (self.current_image_index + 1) % len(self.image_files)
-        self.load_image(self.image_files[self.current_image_index])
+        self.load_image(self.image_files[self.current_image_index],
+                        self.current_image_index)
     
     def previous_image(self):
         """Load the previous image in the directory."""
@@ -1864,17 +2798,34 @@ class MainWindow(QMainWindow):
             return
         
         self.current_image_index = (self.current_image_index - 1) % len(self.image_files)
-        self.load_image(self.image_files[self.current_image_index])
+        self.load_image(self.image_files[self.current_image_index],
+                        self.current_image_index)
     
     # ========================================================================
     # SAVE/LOAD ANNOTATIONS
     # ========================================================================
     
+    def _flush_pending_annotation_load(self):
+        """
+        Run a deferred annotation load immediately if one is pending.
+
+        load_image defers load_annotations behind a short dwell timer;
+        until it fires the scene holds no boxes yet. Any path that writes
+        or unlinks the label file must flush the load first, or it would
+        mistake a not-yet-loaded image for an empty one and destroy its
+        existing annotations.
+        """
+        if self._annotation_timer.isActive():
+            self._annotation_timer.stop()
+            self.load_annotations()
+
     def save_annotations(self):
         """Save annotations in YOLO format."""
         if not self.current_image_path:
             return
-        
+
+        self._flush_pending_annotation_load()
+
         # Determine where to save the label file
         if self.labels_directory:
             # Create labels directory if it doesn't exist
@@ -1897,18 +2848,20 @@ class MainWindow(QMainWindow):
             # If no boxes, create empty file or delete existing one
             if annotation_path.exists():
                 annotation_path.unlink()
+            if self._label_set is not None:
+                self._label_set.discard(self.current_image_path.stem)
             self.unsaved_changes = False
             return
-        
+
         try:
             with open(annotation_path, 'w') as f:
-                for bbox in self.scene.boxes:
-                    yolo_line = bbox.to_yolo_format(
-                        self.scene.image_width,
-                        self.scene.image_height
-                    )
-                    f.write(yolo_line + '\n')
-            
+                f.write(self.scene.export_yolo(
+                    self.scene.image_width,
+                    self.scene.image_height
+                ))
+
+            if self._label_set is not None:
+                self._label_set.add(self.current_image_path.stem)
             self.unsaved_changes = False
             self.statusBar().showMessage(f"Saved annotations: {annotation_path.name} -> {annotation_path.parent.name}/")
         except Exception as e:
@@ -1917,6 +2870,27 @@ class MainWindow(QMainWindow):
                 f"Failed to save annotations: {str(e)}\n\nPath: {annotation_path}"
             )
     
+    def _rebuild_label_index(self):
+        """
+        Scan the labels directory once and index which stems have a .txt.
+
+        Turns the per-navigation annotation_path.exists() stat into a set
+        membership test. Save paths add stems as they write, so the index
+        stays current without rescanning.
+        """
+        directory = self.labels_directory or self.image_directory
+        self._label_set = None
+        if directory is None:
+            return
+        try:
+            with os.scandir(directory) as it:
+                self._label_set = {
+                    entry.name[:-4] for entry in it
+                    if entry.name.endswith('.txt')
+                }
+        except OSError:
+            self._label_set = None
+
     def load_annotations(self):
         """Load existing annotations from YOLO format file automatically."""
         if not self.current_image_path:
@@ -1928,52 +2902,82 @@ class MainWindow(QMainWindow):
         else:
             annotation_path = self.current_image_path.with_suffix('.txt')
         
-        if not annotation_path.exists():
+        # A set lookup against the indexed labels directory replaces a
+        # stat syscall per navigation; fall back to stat when no index
+        # has been built (single-image workflows)
+        if self._label_set is not None:
+            has_label = self.current_image_path.stem in self._label_set
+        else:
+            has_label = annotation_path.exists()
+        if not has_label:
             self.refresh_annotations_list()
             return
         
         try:
-            with open(annotation_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    parts = line.split()
-                    if len(parts) != 5:
-                        continue
-                    
-                    class_id = int(parts[0])
-                    
+            # Parse the whole file in one vectorized pass
+            class_ids, rects = BoundingBox.parse_yolo_file(
+                annotation_path,
+                self.scene.image_width,
+                self.scene.image_height
+            )
+
+            # Bind the per-box lookups to locals once - for dense label
+            # files the loop below is pure interpreter work, and each
+            # attribute chain resolved inside it costs a dict probe per box
+            scene = self.scene
+            cmap_get = self.class_id_map.get
+            get_color = scene.get_box_color
+            add_item = scene.addItem
+            add_label = scene.add_box_label
+            item_map = scene._item_to_bbox
+            boxes_append = scene.boxes.append
+
+            # One pen per class for this load - setPen copies the pen, so
+            # sharing the instance across boxes is safe
+            pens: dict = {}
+
+            # Suspend BSP re-indexing and changed signals while bulk-
+            # adding; every addItem otherwise rebalances the index and
+            # fires a notification. Same batching set_image uses.
+            old_index_method = scene.itemIndexMethod()
+            scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+            scene.blockSignals(True)
+            try:
+                for class_id, (x, y, width, height) in zip(class_ids, rects):
+                    class_id = int(class_id)
+
                     # Get class name from the map
-                    if class_id in self.class_id_map:
-                        class_name = self.class_id_map[class_id]
-                    else:
-                        class_name = f"class_{class_id}"
-                    
-                    # Parse YOLO format
-                    bbox = BoundingBox.from_yolo_format(
-                        line,
-                        self.scene.image_width,
-                        self.scene.image_height,
+                    class_name = cmap_get(class_id) or f"class_{class_id}"
+
+                    bbox = BoundingBox(
+                        QRectF(x, y, width, height),
+                        class_id,
                         class_name
                     )
-                    
-                    if bbox:
-                        # Create graphics item
-                        item = QGraphicsRectItem(bbox.rect)
-                        color = self.scene.get_box_color(bbox.class_id)
-                        pen = QPen(color, 2)
-                        item.setPen(pen)
-                        # No brush - outline only
-                        self.scene.addItem(item)
-                        
-                        # Add label
-                        self.scene.add_box_label(item, bbox.class_name, color)
-                        
-                        bbox.graphics_item = item
-                        self.scene.boxes.append(bbox)
-            
+
+                    # Create graphics item
+                    item = BoxGraphicsItem(bbox.rect)
+                    color = get_color(class_id)
+                    pen = pens.get(class_id)
+                    if pen is None:
+                        pen = pens[class_id] = QPen(color, 2)
+                    item.setPen(pen)
+                    # No brush - outline only
+                    add_item(item)
+
+                    # Add label
+                    add_label(item, class_name, color)
+
+                    bbox.graphics_item = item
+                    item_map[id(item)] = bbox
+                    boxes_append(bbox)
+            finally:
+                scene.blockSignals(False)
+                scene.setItemIndexMethod(old_index_method)
+                scene.update()
+
+            scene._geom_dirty = True
+
             self.refresh_annotations_list()
             self.statusBar().showMessage(f"Loaded {len(self.scene.boxes)} annotation(s) from {annotation_path.name}")
             
@@ -1992,25 +2996,35 @@ class MainWindow(QMainWindow):
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "Choose Labels Directory",
-            current_dir
+            current_dir,
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontUseNativeDialog
         )
         
         if dir_path:
             self.labels_directory = Path(dir_path)
-            
-            # Also save/move classes.txt to labels directory
-            if self.class_file_path:
-                new_class_file_path = self.labels_directory / "classes.txt"
-                
-                # Copy existing classes.txt if it exists
-                if self.class_file_path.exists() and self.class_file_path != new_class_file_path:
-                    import shutil
-                    shutil.copy2(self.class_file_path, new_class_file_path)
-                
-                self.class_file_path = new_class_file_path
-                self.save_classes()
-            
+            self._rebuild_label_index()
+
+            # The classes.txt copy blocks on disk I/O - defer it past the
+            # dialog return so the UI responds immediately
+            QTimer.singleShot(0, self._migrate_classes_file)
+
             self.statusBar().showMessage(f"Labels will be saved to: {self.labels_directory}")
+
+    def _migrate_classes_file(self):
+        """Move/save classes.txt into the current labels directory."""
+        if not (self.labels_directory and self.class_file_path):
+            return
+
+        new_class_file_path = self.labels_directory / "classes.txt"
+
+        # Copy existing classes.txt if it exists
+        if self.class_file_path.exists() and self.class_file_path != new_class_file_path:
+            import shutil
+            shutil.copy2(self.class_file_path, new_class_file_path)
+
+        self.class_file_path = new_class_file_path
+        self.save_classes()
     
     def change_labels_directory(self):
         """Change the labels save directory (user-initiated)."""
@@ -2020,7 +3034,9 @@ class MainWindow(QMainWindow):
         """Export current annotations with user choosing location."""
         if not self.current_image_path:
             return
-        
+
+        self._flush_pending_annotation_load()
+
         if not self.scene.boxes:
             QMessageBox.information(
                 self, "No Annotations",
@@ -2039,25 +3055,26 @@ class MainWindow(QMainWindow):
             self,
             "Export Annotations",
             str(default_path),
-            "Text Files (*.txt);;All Files (*)"
+            "Text Files (*.txt);;All Files (*)",
+            options=QFileDialog.Option.DontUseNativeDialog
         )
         
         if not file_path:
             return
         
         try:
-            # Write annotations to file
+            # Write annotations to file (vectorized batch export)
             with open(file_path, 'w') as f:
-                for bbox in self.scene.boxes:
-                    yolo_line = bbox.to_yolo_format(
-                        self.scene.image_width,
-                        self.scene.image_height
-                    )
-                    f.write(yolo_line + '\n')
-            
-            # Update labels directory to the parent of saved file
+                f.write(self.scene.export_yolo(
+                    self.scene.image_width,
+                    self.scene.image_height
+                ))
+
+            # Update labels directory to the parent of saved file, and
+            # reindex - the sidecar set still describes the old directory
             self.labels_directory = Path(file_path).parent
-            
+            self._rebuild_label_index()
+
             self.statusBar().showMessage(
                 f"Exported {len(self.scene.boxes)} annotation(s) to {Path(file_path).name}"
             )
@@ -2090,6 +3107,12 @@ def main():
     Author: Ahmed Fekry
     LinkedIn: www.linkedin.com/in/ahmed-fekry07
     """
+    # MSAA for the OpenGL viewport - must be set before the QApplication
+    from PyQt6.QtGui import QSurfaceFormat
+    surface_format = QSurfaceFormat.defaultFormat()
+    surface_format.setSamples(4)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+
     app = QApplication(sys.argv)
     app.setApplicationName("YOLO Annotator")
     app.setOrganizationName("Ahmed Fekry")